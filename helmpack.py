@@ -7,36 +7,64 @@ A tool to package any Helm chart with all dependencies and images for offline de
 import os
 import sys
 import json
+import hashlib
 import yaml
+import gzip
 import tarfile
 import tempfile
 import subprocess
 import shutil
 import re
+import time
 import logging
+import functools
+import contextlib
+import threading
+from collections import defaultdict, deque
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Callable, Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
 from urllib.parse import urlparse
+import importlib.util
 import click
-import requests
 
-# Optional imports with graceful fallback
+# Prefer the LibYAML C bindings when available
 try:
-    from docker import from_env as docker_from_env
-    from docker.errors import ImageNotFound, APIError
-    DOCKER_AVAILABLE = True
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
 except ImportError:
-    DOCKER_AVAILABLE = False
-    
-    # Create dummy classes for type hints
-    class ImageNotFound(Exception):
-        pass
-    class APIError(Exception):
-        pass
-    
-    def docker_from_env():
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# The Docker SDK (and the requests/urllib3 stack under it) is only imported on first use
+DOCKER_AVAILABLE = importlib.util.find_spec('docker') is not None
+
+def docker_from_env():
+    """Create a Docker client from the environment, importing the SDK lazily."""
+    if not DOCKER_AVAILABLE:
         raise RuntimeError("Docker module not available")
+    from docker import from_env
+    return from_env()
+
+def _docker_errors() -> tuple:
+    """Docker SDK exceptions that indicate an expected image operation failure."""
+    try:
+        from docker.errors import ImageNotFound, APIError
+    except ImportError:
+        return ()
+    return ImageNotFound, APIError
+
+# Optional faster JSON parser; both accept bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional gzip accelerators, imported only by the commands that read bundles:
+# rapidgzip (parallel inflate), isal (SIMD inflate)
+RAPIDGZIP_AVAILABLE = importlib.util.find_spec('rapidgzip') is not None
+ISAL_AVAILABLE = importlib.util.find_spec('isal') is not None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -45,6 +73,118 @@ logger = logging.getLogger(__name__)
 if not DOCKER_AVAILABLE:
     logger.warning("⚠️  Docker Python module not available. Image bundling will be limited.")
 
+@functools.lru_cache(maxsize=None)
+def _disable_insecure_warnings():
+    """Silence urllib3's InsecureRequestWarning; cached so the filter is installed only once."""
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+@functools.lru_cache(maxsize=None)
+def _http_session():
+    """Shared HTTP session so repeated Harbor API calls reuse pooled connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Image archives pulling or spooled on disk and waiting to enter the bundle, at most
+_IMAGE_BACKLOG = 8
+
+# Single-pass pattern for image references in raw template files
+_IMAGE_RE = re.compile(rb'(?:\.?image:|\.image)\s*["\']?([^"\s]+)["\']?', re.IGNORECASE)
+
+# Exact chart version (no range operators), as used in '<name>-<version>.tgz'
+_PLAIN_VERSION_RE = re.compile(r'^v?[0-9]+\.[0-9]+\.[0-9]+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$')
+
+# registry (host with a dot or port) / repository : tag @ digest
+_IMG_REF_RE = re.compile(
+    r'^(?:(?P<registry>[^/]+\.[^/]+|[^/]+:[0-9]+)/)?'
+    r'(?P<repo>[^:@]+)'
+    r'(?::(?P<tag>[^@/]+))?'
+    r'(?:@(?P<digest>[A-Za-z][A-Za-z0-9]*(?:[+._-][A-Za-z][A-Za-z0-9]*)*:[0-9a-fA-F]{32,}))?$'
+)
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink a file into place, falling back to a copy (e.g. across devices)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+def _image_archive_name(image_ref: str) -> str:
+    """File name of an image's saved archive inside a bundle's images/ directory."""
+    return f"{image_ref.replace('/', '_').replace(':', '_')}.tar"
+
+def _list_subdirs(path: str) -> List[str]:
+    """Names of the directories directly under path (scandir avoids a stat per entry)."""
+    with os.scandir(path) as it:
+        return [entry.name for entry in it if entry.is_dir()]
+
+def _open_fast_gzip(archive_path: str):
+    """Open a gzip file with the fastest optional decoder, or return None if none is installed."""
+    if RAPIDGZIP_AVAILABLE:
+        import rapidgzip
+        return rapidgzip.RapidgzipFile(archive_path, parallelization=os.cpu_count() or 1)
+    if ISAL_AVAILABLE:
+        from isal import igzip
+        return igzip.open(archive_path, 'rb')
+    return None
+
+def _extract_tar_stream(archive_path: str, dest: str, fast: bool = False):
+    """Extract a gzipped tarball in a single sequential pass.
+    
+    With fast=True the optional gzip accelerators are used; they only pay off on
+    large bundles, so small chart archives stay on zlib.
+    """
+    decompressed = _open_fast_gzip(archive_path) if fast else None
+    if decompressed is not None:
+        f, mode = decompressed, 'r|'
+    else:
+        f, mode = open(archive_path, 'rb'), 'r|gz'
+    
+    with f, tarfile.open(fileobj=f, mode=mode) as tar:
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(dest, filter='data')
+        else:
+            tar.extractall(dest)
+
+# Bounds for $XDG_CACHE_HOME/helmpack (info summaries)
+_CACHE_MAX_ENTRIES = 64
+_CACHE_MAX_AGE = 30 * 24 * 3600
+
+def _cache_dir() -> str:
+    """Per-user cache directory for derived bundle data ($XDG_CACHE_HOME/helmpack)."""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_root, 'helmpack')
+
+def _bundle_cache_key(bundle_path: str) -> str:
+    """Cache key for a bundle file; changes whenever the file is replaced or rewritten."""
+    st = os.stat(bundle_path)
+    return hashlib.sha256(
+        f"{os.path.abspath(bundle_path)}|{st.st_mtime_ns}|{st.st_size}".encode()
+    ).hexdigest()
+
+@contextlib.contextmanager
+def _open_bundle_tar(bundle_path: str):
+    """Open a bundle tarball for reading with the fastest available gzip decoder.
+    
+    The archive is read as a single forward stream, so members must be consumed in order.
+    """
+    f = _open_fast_gzip(bundle_path)
+    mode = 'r|'
+    if f is None:
+        f, mode = open(bundle_path, 'rb'), 'r|gz'
+    
+    with f, tarfile.open(fileobj=f, mode=mode) as tar:
+        yield tar
+
 @dataclass
 class ImageInfo:
     """Information about a discovered container image."""
@@ -67,21 +207,22 @@ class ChartInfo:
     images: List[ImageInfo]
 
 class HelmChartAnalyzer:
-    """Analyzes Helm charts to discover all images and dependencies."""
+    """Analyzes Helm charts to discover all images and dependencies.
     
-    def __init__(self):
-        self.docker_client = None
+    If on_image is given, it is called with each image as soon as the chart
+    (or subchart) referencing it has been analyzed, possibly from worker threads.
+    """
+    
+    def __init__(self, on_image: Optional[Callable[[ImageInfo], None]] = None):
+        self.on_image = on_image
         self.discovered_images: Set[str] = set()
         self.temp_dirs: List[str] = []
+        self._lock = threading.Lock()
+        self._yaml_cache: Dict[Tuple[str, int], dict] = {}
+        self._deps_updated: Set[str] = set()
+        self._ref_cache: Dict[Tuple[str, str], Optional[ImageInfo]] = {}
         
     def __enter__(self):
-        if DOCKER_AVAILABLE:
-            try:
-                self.docker_client = docker_from_env()
-            except Exception as e:
-                logger.warning(f"Docker client not available: {e}")
-        else:
-            logger.warning("Docker module not installed. Image operations will be skipped.")
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -99,11 +240,10 @@ class HelmChartAnalyzer:
         
         # Parse Chart.yaml
         chart_yaml_path = os.path.join(chart_path, "Chart.yaml")
-        if not os.path.exists(chart_yaml_path):
+        try:
+            chart_yaml = self._load_yaml_cached(chart_yaml_path)
+        except FileNotFoundError:
             raise ValueError(f"Chart.yaml not found in {chart_path}")
-            
-        with open(chart_yaml_path, 'r') as f:
-            chart_yaml = yaml.safe_load(f)
         
         chart_name = chart_yaml.get('name', 'unknown')
         chart_version = chart_yaml.get('version', '0.0.0')
@@ -114,7 +254,7 @@ class HelmChartAnalyzer:
         dependencies = self._discover_dependencies(chart_path, chart_yaml)
         
         # Discover images from this chart
-        images = self._discover_images(chart_path, chart_name)
+        images = self._discover_images(chart_path, chart_name, chart_yaml)
         
         # Combine images from dependencies
         all_images = images.copy()
@@ -129,6 +269,14 @@ class HelmChartAnalyzer:
             images=all_images
         )
     
+    def _load_yaml_cached(self, path: str):
+        """Load a YAML file, reusing the parsed result while the file is unchanged."""
+        key = (path, os.stat(path).st_mtime_ns)
+        if key not in self._yaml_cache:
+            with open(path, 'r') as f:
+                self._yaml_cache[key] = yaml.load(f, Loader=_Loader)
+        return self._yaml_cache[key]
+    
     def _prepare_chart(self, chart_path_or_url: str) -> str:
         """Prepare chart for analysis (download if URL, copy if local)."""
         if chart_path_or_url.startswith(('http://', 'https://', 'oci://')):
@@ -143,7 +291,8 @@ class HelmChartAnalyzer:
     def _download_chart(self, chart_url: str) -> str:
         """Download a chart from a repository or OCI registry."""
         temp_dir = tempfile.mkdtemp(prefix="helmpack_")
-        self.temp_dirs.append(temp_dir)
+        with self._lock:
+            self.temp_dirs.append(temp_dir)
         
         try:
             if chart_url.startswith('oci://'):
@@ -157,7 +306,7 @@ class HelmChartAnalyzer:
             logger.info(f"✅ Chart downloaded to {temp_dir}")
             
             # Find the extracted chart directory
-            chart_dirs = [d for d in os.listdir(temp_dir) if os.path.isdir(os.path.join(temp_dir, d))]
+            chart_dirs = _list_subdirs(temp_dir)
             if not chart_dirs:
                 raise ValueError("No chart directory found after extraction")
             
@@ -170,13 +319,13 @@ class HelmChartAnalyzer:
     def _extract_chart_archive(self, archive_path: str) -> str:
         """Extract a chart archive (.tgz) to temporary directory."""
         temp_dir = tempfile.mkdtemp(prefix="helmpack_")
-        self.temp_dirs.append(temp_dir)
+        with self._lock:
+            self.temp_dirs.append(temp_dir)
         
-        with tarfile.open(archive_path, 'r:gz') as tar:
-            tar.extractall(temp_dir)
+        _extract_tar_stream(archive_path, temp_dir)
         
         # Find the extracted chart directory
-        chart_dirs = [d for d in os.listdir(temp_dir) if os.path.isdir(os.path.join(temp_dir, d))]
+        chart_dirs = _list_subdirs(temp_dir)
         if not chart_dirs:
             raise ValueError("No chart directory found in archive")
         
@@ -192,59 +341,117 @@ class HelmChartAnalyzer:
         
         logger.info(f"🔗 Found {len(deps)} dependencies")
         
-        # Update dependencies
-        try:
-            subprocess.run(['helm', 'dependency', 'update', chart_path], 
-                         capture_output=True, check=True, cwd=chart_path)
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"Failed to update dependencies: {e}")
+        # Update dependencies unless they are already vendored or were updated this run
+        charts_dir = os.path.join(chart_path, 'charts')
+        chart_key = os.path.realpath(chart_path)
+        with self._lock:
+            needs_update = chart_key not in self._deps_updated
+            self._deps_updated.add(chart_key)
+        
+        if needs_update and not self._dependencies_vendored(chart_path, charts_dir, deps):
+            try:
+                subprocess.run(['helm', 'dependency', 'update', chart_path], 
+                             capture_output=True, check=True, cwd=chart_path)
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"Failed to update dependencies: {e}")
+        else:
+            logger.debug(f"Skipping dependency update for {chart_path}")
         
         # Analyze each dependency
-        charts_dir = os.path.join(chart_path, 'charts')
-        if os.path.exists(charts_dir):
-            for dep_file in os.listdir(charts_dir):
-                if dep_file.endswith('.tgz'):
-                    dep_path = os.path.join(charts_dir, dep_file)
-                    try:
-                        dep_chart = self.analyze_chart(dep_path)
-                        dependencies.append(dep_chart)
-                        logger.info(f"  📦 Dependency: {dep_chart.name} v{dep_chart.version}")
-                    except Exception as e:
-                        logger.warning(f"Failed to analyze dependency {dep_file}: {e}")
+        try:
+            dep_files = [f for f in os.listdir(charts_dir) if f.endswith('.tgz')]
+        except FileNotFoundError:
+            dep_files = []
+        
+        if not dep_files:
+            return dependencies
+        
+        # Dependencies are independent, so analyze them concurrently
+        max_workers = min(8, (os.cpu_count() or 1) * 2, len(dep_files))
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.analyze_chart, os.path.join(charts_dir, dep_file)): dep_file
+                for dep_file in dep_files
+            }
+            for future in as_completed(futures):
+                dep_file = futures[future]
+                try:
+                    dep_chart = future.result()
+                    results[dep_file] = dep_chart
+                    logger.info(f"  📦 Dependency: {dep_chart.name} v{dep_chart.version}")
+                except Exception as e:
+                    logger.warning(f"Failed to analyze dependency {dep_file}: {e}")
+        
+        # Keep a stable, directory-listing order regardless of completion order
+        dependencies.extend(results[f] for f in dep_files if f in results)
         
         return dependencies
     
-    def _discover_images(self, chart_path: str, chart_name: str) -> List[ImageInfo]:
+    def _dependencies_vendored(self, chart_path: str, charts_dir: str, deps: List[dict]) -> bool:
+        """Check whether every declared dependency already has its exact archive in charts/.
+        
+        Range constraints are resolved through Chart.lock; without a lock entry for
+        the dependency the charts/ contents cannot be trusted and helm must update.
+        """
+        try:
+            archives = {f for f in os.listdir(charts_dir) if f.endswith('.tgz')}
+        except FileNotFoundError:
+            return False
+        
+        locked = None
+        for dep in deps:
+            name = dep.get('name')
+            if not name:
+                continue
+            version = str(dep.get('version', ''))
+            if not _PLAIN_VERSION_RE.match(version):
+                if locked is None:
+                    locked = self._locked_dependency_versions(chart_path)
+                version = locked.get(name)
+                if not version:
+                    return False
+            if f"{name}-{version}.tgz" not in archives:
+                return False
+        return True
+    
+    def _locked_dependency_versions(self, chart_path: str) -> Dict[str, str]:
+        """Map dependency names to the resolved versions recorded in Chart.lock."""
+        try:
+            lock = self._load_yaml_cached(os.path.join(chart_path, 'Chart.lock')) or {}
+        except (FileNotFoundError, yaml.YAMLError):
+            return {}
+        
+        return {dep.get('name'): str(dep.get('version', ''))
+                for dep in lock.get('dependencies') or [] if isinstance(dep, dict)}
+    
+    def _discover_images(self, chart_path: str, chart_name: str, chart_yaml: dict) -> List[ImageInfo]:
         """Discover all container images referenced in the chart."""
         logger.info(f"🔍 Discovering images in chart: {chart_name}")
         
         images = []
+        # References already parsed by any method, so duplicates are skipped early
+        seen: Set[str] = set()
         
         # Method 1: Parse existing annotations (if any)
-        images.extend(self._parse_chart_annotations(chart_path, chart_name))
+        images.extend(self._parse_chart_annotations(chart_yaml, chart_name, seen))
         
         # Method 2: Render templates and extract images
-        images.extend(self._extract_images_from_templates(chart_path, chart_name))
+        images.extend(self._extract_images_from_templates(chart_path, chart_name, seen))
         
         # Method 3: Parse values.yaml for image references
-        images.extend(self._parse_values_for_images(chart_path, chart_name))
+        images.extend(self._parse_values_for_images(chart_path, chart_name, seen))
         
-        # Remove duplicates
-        unique_images = {}
-        for img in images:
-            unique_images[img.full_reference] = img
+        logger.info(f"✅ Found {len(images)} unique images in {chart_name}")
         
-        result = list(unique_images.values())
-        logger.info(f"✅ Found {len(result)} unique images in {chart_name}")
+        if self.on_image:
+            for img in images:
+                self.on_image(img)
         
-        return result
+        return images
     
-    def _parse_chart_annotations(self, chart_path: str, chart_name: str) -> List[ImageInfo]:
+    def _parse_chart_annotations(self, chart_yaml: dict, chart_name: str, seen: Set[str]) -> List[ImageInfo]:
         """Parse images from Chart.yaml annotations."""
-        chart_yaml_path = os.path.join(chart_path, "Chart.yaml")
-        with open(chart_yaml_path, 'r') as f:
-            chart_yaml = yaml.safe_load(f)
-        
         images = []
         annotations = chart_yaml.get('annotations', {})
         
@@ -254,12 +461,15 @@ class HelmChartAnalyzer:
             try:
                 if isinstance(images_annotation, str):
                     # YAML string format
-                    image_list = yaml.safe_load(images_annotation)
+                    image_list = yaml.load(images_annotation, Loader=_Loader)
                 else:
                     image_list = images_annotation
                 
                 for item in image_list:
                     if isinstance(item, dict) and 'image' in item:
+                        if item['image'] in seen:
+                            continue
+                        seen.add(item['image'])
                         img_info = self._parse_image_reference(item['image'], chart_name)
                         if img_info:
                             images.append(img_info)
@@ -270,9 +480,12 @@ class HelmChartAnalyzer:
         artifacthub_images = annotations.get('artifacthub.io/images')
         if artifacthub_images:
             try:
-                image_list = yaml.safe_load(artifacthub_images)
+                image_list = yaml.load(artifacthub_images, Loader=_Loader)
                 for item in image_list:
                     if isinstance(item, dict) and 'image' in item:
+                        if item['image'] in seen:
+                            continue
+                        seen.add(item['image'])
                         img_info = self._parse_image_reference(item['image'], chart_name)
                         if img_info:
                             images.append(img_info)
@@ -281,56 +494,54 @@ class HelmChartAnalyzer:
         
         return images
     
-    def _extract_images_from_templates(self, chart_path: str, chart_name: str) -> List[ImageInfo]:
+    def _extract_images_from_templates(self, chart_path: str, chart_name: str, seen: Set[str]) -> List[ImageInfo]:
         """Extract images by rendering Helm templates."""
         images = []
         
         try:
             # Render templates with default values
             cmd = ['helm', 'template', 'test-release', chart_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Keep stdout as bytes; the YAML parser decodes the stream itself
+            result = subprocess.run(cmd, capture_output=True, check=True)
             
             # Parse rendered YAML to find image references
-            documents = result.stdout.split('---')
-            
-            for doc in documents:
-                if not doc.strip():
-                    continue
-                
-                try:
-                    yaml_doc = yaml.safe_load(doc)
+            try:
+                for yaml_doc in yaml.load_all(result.stdout, Loader=_Loader):
                     if yaml_doc:
-                        found_images = self._extract_images_from_yaml(yaml_doc, chart_name)
+                        found_images = self._extract_images_from_yaml(yaml_doc, chart_name, seen)
                         images.extend(found_images)
-                except yaml.YAMLError:
-                    continue
+            except yaml.YAMLError as e:
+                logger.warning(f"Failed to parse rendered templates for {chart_name}: {e}")
         
         except subprocess.CalledProcessError as e:
-            logger.warning(f"Failed to render templates for {chart_name}: {e.stderr}")
+            stderr = e.stderr.decode(errors='replace') if e.stderr else e.stderr
+            logger.warning(f"Failed to render templates for {chart_name}: {stderr}")
             # Fallback to manual template parsing
-            images.extend(self._parse_templates_manually(chart_path, chart_name))
+            images.extend(self._parse_templates_manually(chart_path, chart_name, seen))
         
         return images
     
-    def _parse_values_for_images(self, chart_path: str, chart_name: str) -> List[ImageInfo]:
+    def _parse_values_for_images(self, chart_path: str, chart_name: str, seen: Set[str]) -> List[ImageInfo]:
         """Parse values.yaml files for image references."""
         images = []
         
         values_files = ['values.yaml', 'values.yml']
         for values_file in values_files:
             values_path = os.path.join(chart_path, values_file)
-            if os.path.exists(values_path):
-                with open(values_path, 'r') as f:
-                    try:
-                        values = yaml.safe_load(f)
-                        found_images = self._extract_images_from_yaml(values, chart_name)
-                        images.extend(found_images)
-                    except yaml.YAMLError as e:
-                        logger.warning(f"Failed to parse {values_file}: {e}")
+            try:
+                values = self._load_yaml_cached(values_path)
+            except FileNotFoundError:
+                continue
+            except yaml.YAMLError as e:
+                logger.warning(f"Failed to parse {values_file}: {e}")
+                continue
+            
+            found_images = self._extract_images_from_yaml(values, chart_name, seen)
+            images.extend(found_images)
         
         return images
     
-    def _parse_templates_manually(self, chart_path: str, chart_name: str) -> List[ImageInfo]:
+    def _parse_templates_manually(self, chart_path: str, chart_name: str, seen: Set[str]) -> List[ImageInfo]:
         """Manually parse template files for image references."""
         images = []
         templates_dir = os.path.join(chart_path, 'templates')
@@ -338,60 +549,77 @@ class HelmChartAnalyzer:
         if not os.path.exists(templates_dir):
             return images
         
-        # Common image reference patterns
-        image_patterns = [
-            r'image:\s*["\']?([^"\s]+)["\']?',
-            r'Image:\s*["\']?([^"\s]+)["\']?',
-            r'\.image\s*["\']?([^"\s]+)["\']?',
-            r'\.Image\s*["\']?([^"\s]+)["\']?',
-        ]
-        
         for root, dirs, files in os.walk(templates_dir):
             for file in files:
                 if file.endswith(('.yaml', '.yml')):
                     file_path = os.path.join(root, file)
                     try:
-                        with open(file_path, 'r') as f:
+                        with open(file_path, 'rb') as f:
                             content = f.read()
-                            
-                            for pattern in image_patterns:
-                                matches = re.finditer(pattern, content, re.IGNORECASE)
-                                for match in matches:
-                                    image_ref = match.group(1)
-                                    # Skip template variables
-                                    if not ('{{' in image_ref or '}}' in image_ref):
-                                        img_info = self._parse_image_reference(image_ref, chart_name)
-                                        if img_info:
-                                            images.append(img_info)
+                        
+                        for match in _IMAGE_RE.finditer(content):
+                            image_ref = match.group(1)
+                            # Skip template variables
+                            if b'{{' in image_ref or b'}}' in image_ref:
+                                continue
+                            image_ref = image_ref.decode('utf-8', errors='replace')
+                            if image_ref in seen:
+                                continue
+                            seen.add(image_ref)
+                            img_info = self._parse_image_reference(image_ref, chart_name)
+                            if img_info:
+                                images.append(img_info)
                     except Exception as e:
                         logger.warning(f"Failed to parse template {file_path}: {e}")
         
         return images
     
-    def _extract_images_from_yaml(self, yaml_obj, chart_name: str) -> List[ImageInfo]:
-        """Recursively extract image references from YAML object."""
+    def _extract_images_from_yaml(self, yaml_obj, chart_name: str, seen: Set[str]) -> List[ImageInfo]:
+        """Extract image references from a YAML object using an explicit stack."""
         images = []
         
-        if isinstance(yaml_obj, dict):
-            for key, value in yaml_obj.items():
-                if key.lower() == 'image' and isinstance(value, str):
-                    img_info = self._parse_image_reference(value, chart_name)
-                    if img_info:
-                        images.append(img_info)
-                elif isinstance(value, (dict, list)):
-                    images.extend(self._extract_images_from_yaml(value, chart_name))
-        elif isinstance(yaml_obj, list):
-            for item in yaml_obj:
-                if isinstance(item, (dict, list)):
-                    images.extend(self._extract_images_from_yaml(item, chart_name))
+        # Anchored blocks are shared objects after loading; walk each one only once
+        visited: Set[int] = set()
+        stack = deque([yaml_obj])
+        
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if isinstance(value, str):
+                        if not (isinstance(key, str) and key.lower() == 'image') or value in seen:
+                            continue
+                        seen.add(value)
+                        img_info = self._parse_image_reference(value, chart_name)
+                        if img_info:
+                            images.append(img_info)
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
         
         return images
     
     def _parse_image_reference(self, image_ref: str, chart_source: str) -> Optional[ImageInfo]:
         """Parse a container image reference into components."""
-        if not image_ref or image_ref.startswith('{{'):
+        # Cheap rejects for template noise, literals and file paths
+        if (not image_ref or len(image_ref) < 3 or image_ref[0] in '{<$'
+                or image_ref in ('true', 'false', 'null')
+                or image_ref.startswith(('/', './', '../'))):
             return None
         
+        # Values commonly repeat the same reference across many resources
+        cache_key = (image_ref, chart_source)
+        if cache_key not in self._ref_cache:
+            self._ref_cache[cache_key] = self._parse_image_reference_uncached(image_ref, chart_source)
+        return self._ref_cache[cache_key]
+    
+    def _parse_image_reference_uncached(self, image_ref: str, chart_source: str) -> Optional[ImageInfo]:
+        """Split a container image reference into registry, repository, tag and digest."""
         # Clean up the reference
         image_ref = image_ref.strip().strip('"\'')
         
@@ -399,38 +627,24 @@ class HelmChartAnalyzer:
         if not image_ref or '{{' in image_ref or '}}' in image_ref:
             return None
         
-        # Parse registry, repository, and tag
-        parts = image_ref.split('/')
-        
-        if '.' in parts[0] or ':' in parts[0]:
-            # Has registry
-            registry = parts[0]
-            repo_parts = parts[1:]
-        else:
-            # No registry, use Docker Hub
-            registry = 'docker.io'
-            repo_parts = parts
-        
-        if not repo_parts:
+        # Parse registry, repository, tag and digest
+        match = _IMG_REF_RE.match(image_ref)
+        if not match and '@' in image_ref:
+            # Unrecognized digest; keep the reference and leave the digest unset
+            match = _IMG_REF_RE.match(image_ref.split('@', 1)[0])
+        if not match:
             return None
         
-        # Handle tag
-        last_part = repo_parts[-1]
-        if ':' in last_part:
-            repo_parts[-1], tag = last_part.rsplit(':', 1)
-        else:
-            tag = 'latest'
-        
-        repository = '/'.join(repo_parts)
-        name = repo_parts[-1]
+        repository = match.group('repo')
         
         return ImageInfo(
-            name=name,
-            tag=tag,
-            registry=registry,
+            name=repository.rsplit('/', 1)[-1],
+            tag=match.group('tag') or 'latest',
+            registry=match.group('registry') or 'docker.io',
             repository=repository,
             full_reference=image_ref,
-            chart_source=chart_source
+            chart_source=chart_source,
+            digest=match.group('digest')
         )
 
 class HelmPackBundler:
@@ -438,6 +652,9 @@ class HelmPackBundler:
     
     def __init__(self):
         self.docker_client = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetched: Dict[str, Future] = {}
+        self._prefetch_lock = threading.Lock()
         
     def __enter__(self):
         try:
@@ -447,7 +664,29 @@ class HelmPackBundler:
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        if self._prefetch_executor:
+            for future in self._prefetched.values():
+                future.cancel()
+            # Running pulls cannot be interrupted, and the interpreter joins pool
+            # threads at exit anyway, so wait here where the delay is explained
+            in_flight = sum(1 for future in self._prefetched.values() if not future.done())
+            if in_flight:
+                logger.info(f"⏳ Waiting for {in_flight} in-flight image pulls to finish...")
+            self._prefetch_executor.shutdown(wait=True)
+    
+    def prefetch_image(self, image: ImageInfo):
+        """Start pulling an image in the background so it is local by the time it is bundled."""
+        if not self.docker_client:
+            return
+        
+        with self._prefetch_lock:
+            if image.full_reference in self._prefetched:
+                return
+            if self._prefetch_executor is None:
+                # Same limit as bundling pulls to respect registry rate limits
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=4)
+            self._prefetched[image.full_reference] = self._prefetch_executor.submit(
+                self.docker_client.images.pull, image.full_reference)
     
     def create_bundle(self, chart_info: ChartInfo, output_path: str, 
                      pull_images: bool = True, include_signatures: bool = False) -> str:
@@ -462,6 +701,8 @@ class HelmPackBundler:
         else:
             bundle_path = bundle_name
         
+        images = self._unique_images(chart_info.images)
+        
         with tempfile.TemporaryDirectory(prefix="helmpack_bundle_") as temp_dir:
             bundle_dir = os.path.join(temp_dir, f"{chart_info.name}-{chart_info.version}")
             os.makedirs(bundle_dir, exist_ok=True)
@@ -473,85 +714,166 @@ class HelmPackBundler:
                 "metadata": {
                     "name": chart_info.name,
                     "version": chart_info.version,
-                    "generatedAt": subprocess.run(['date', '-Iseconds'], 
-                                                capture_output=True, text=True).stdout.strip(),
+                    "generatedAt": datetime.now(timezone.utc).isoformat(timespec='seconds'),
                     "generatedBy": "HelmPack Universal Bundler",
                     "bundlePath": bundle_path,
-                    "totalImages": len(chart_info.images),
+                    "totalImages": len(images),
                     "totalDependencies": len(chart_info.dependencies)
                 },
                 "chart": asdict(chart_info),
-                "images": [asdict(img) for img in chart_info.images]
+                "images": [asdict(img) for img in images]
             }
             
-            # Ensure bundle directory exists
-            os.makedirs(bundle_dir, exist_ok=True)
-            
             with open(os.path.join(bundle_dir, "bundle.yaml"), 'w') as f:
-                yaml.safe_dump(metadata, f, default_flow_style=False)
+                yaml.dump(metadata, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
             
-            # Copy chart files
-            chart_dir = os.path.join(bundle_dir, "chart")
-            shutil.copytree(chart_info.path, chart_dir)
+            # Same metadata as JSON, which is much cheaper to read back
+            with open(os.path.join(bundle_dir, "bundle.json"), 'w') as f:
+                json.dump(metadata, f)
             
-            # Pull and save images if requested
-            if pull_images and chart_info.images:
-                self._pull_and_save_images(chart_info.images, bundle_dir)
+            # Link chart files; the staging dir is only read back into the tarball
+            chart_dir = os.path.join(bundle_dir, "chart")
+            shutil.copytree(chart_info.path, chart_dir, copy_function=_link_or_copy)
             
-            # Create tarball
-            with tarfile.open(bundle_path, 'w:gz') as tar:
-                tar.add(bundle_dir, arcname=os.path.basename(bundle_dir))
+            # Create tarball; image archives are barely compressible, so favor speed.
+            # Write under a temporary name so a failed run never leaves a valid-looking bundle.
+            arc_root = os.path.basename(bundle_dir)
+            partial_path = bundle_path + '.partial'
+            try:
+                with open(partial_path, 'wb') as raw, \
+                        gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=1) as gz, \
+                        tarfile.open(fileobj=gz, mode='w|') as tar:
+                    tar.add(bundle_dir, arcname=arc_root)
+                    
+                    # Pull images and stream them straight into the tarball if requested
+                    if pull_images and images:
+                        self._pull_images_into_tar(images, tar, arc_root, temp_dir)
+                os.replace(partial_path, bundle_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(partial_path)
+                raise
         
         logger.info(f"🎉 Bundle created: {bundle_path}")
         return bundle_path
     
-    def _pull_and_save_images(self, images: List[ImageInfo], bundle_dir: str):
-        """Pull and save container images."""
+    @staticmethod
+    def _unique_images(images: List[ImageInfo]) -> List[ImageInfo]:
+        """Drop repeated references and references whose archive name is already taken.
+        
+        Subcharts often share images, and distinct references can map to the same
+        archive file; a bundled entry must always point at its own image.
+        """
+        unique: Dict[str, ImageInfo] = {}
+        for image in images:
+            existing = unique.setdefault(_image_archive_name(image.full_reference), image)
+            if existing.full_reference != image.full_reference:
+                logger.warning(f"⚠️  Skipping {image.full_reference}: archive name clashes with {existing.full_reference}")
+        return list(unique.values())
+    
+    def _pull_images_into_tar(self, images: List[ImageInfo], tar: tarfile.TarFile, arc_root: str,
+                              spool_dir: str):
+        """Pull container images and add them to the bundle tarball."""
         if not self.docker_client:
             logger.warning("⚠️  Docker not available, skipping image pull")
             return
         
-        images_dir = os.path.join(bundle_dir, "images")
-        os.makedirs(images_dir, exist_ok=True)
+        images_dir = tarfile.TarInfo(f"{arc_root}/images")
+        images_dir.type = tarfile.DIRTYPE
+        images_dir.mode = 0o755
+        images_dir.mtime = int(time.time())
+        tar.addfile(images_dir)
         
         logger.info(f"🐳 Pulling {len(images)} images...")
         
-        for i, image in enumerate(images, 1):
+        progress = {'count': 0}
+        progress_lock = threading.Lock()
+        
+        # Gzip writing is slower than pulling; stop workers from running far ahead of it
+        backlog = threading.Semaphore(_IMAGE_BACKLOG)
+        
+        def pull_one(image: ImageInfo):
+            backlog.acquire()
+            with progress_lock:
+                progress['count'] += 1
+                i = progress['count']
+            return self._pull_and_spool_image(image, i, len(images), spool_dir)
+        
+        # Workers pull concurrently; only this thread writes to the tarball.
+        # Pulls are network-bound; keep concurrency low to respect registry rate limits
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(pull_one, image) for image in images]
             try:
-                logger.info(f"  [{i}/{len(images)}] Pulling {image.full_reference}")
-                
-                # Pull image
+                for future in as_completed(futures):
+                    pulled = future.result()
+                    if pulled:
+                        image_filename, spool = pulled
+                        with spool:
+                            tarinfo = tarfile.TarInfo(f"{arc_root}/images/{image_filename}")
+                            tarinfo.size = spool.tell()
+                            tarinfo.mode = 0o644
+                            tarinfo.mtime = int(time.time())
+                            spool.seek(0)
+                            tar.addfile(tarinfo, spool)
+                    backlog.release()
+            except BaseException:
+                # Unblock workers waiting on the backlog so the pool can shut down
+                for future in futures:
+                    future.cancel()
+                for _ in futures:
+                    backlog.release()
+                raise
+    
+    def _pull_and_spool_image(self, image: ImageInfo, i: int, total: int, spool_dir: str):
+        """Pull a single container image and spool its saved archive to a file in spool_dir.
+        
+        Returns (filename, spool) on success, None on failure.
+        """
+        try:
+            logger.info(f"  [{i}/{total}] Pulling {image.full_reference}")
+            
+            # Pull image, reusing a background prefetch if one was started
+            with self._prefetch_lock:
+                prefetched = self._prefetched.get(image.full_reference)
+            if prefetched and not prefetched.cancelled():
+                pulled_image = prefetched.result()
+            else:
                 pulled_image = self.docker_client.images.pull(image.full_reference)
-                
-                # Save image to tar file
-                image_filename = f"{image.full_reference.replace('/', '_').replace(':', '_')}.tar"
-                image_path = os.path.join(images_dir, image_filename)
-                
-                with open(image_path, 'wb') as f:
-                    for chunk in pulled_image.save():
-                        f.write(chunk)
-                
-                # Update image info with digest
-                image.digest = pulled_image.id
-                
-            except (ImageNotFound, APIError) as e:
-                logger.error(f"❌ Failed to pull {image.full_reference}: {e}")
-            except Exception as e:
-                logger.error(f"❌ Unexpected error pulling {image.full_reference}: {e}")
+            
+            # Spool image archive to disk; archives can be several GB each
+            image_filename = _image_archive_name(image.full_reference)
+            spool = tempfile.TemporaryFile(dir=spool_dir)
+            try:
+                for chunk in pulled_image.save():
+                    spool.write(chunk)
+            except Exception:
+                spool.close()
+                raise
+            
+            # Update image info with digest
+            image.digest = pulled_image.id
+            
+            return image_filename, spool
+            
+        except _docker_errors() as e:
+            logger.error(f"❌ Failed to pull {image.full_reference}: {e}")
+        except Exception as e:
+            logger.error(f"❌ Unexpected error pulling {image.full_reference}: {e}")
+        return None
 
 class HelmPackImporter:
     """Imports bundles into air-gapped environments."""
     
     def __init__(self, harbor_url: str, harbor_username: str, harbor_password: str, insecure: bool = False):
         self.harbor_url = harbor_url.rstrip('/')
+        self.harbor_host = self.harbor_url.split('://')[-1]
         self.harbor_username = harbor_username
         self.harbor_password = harbor_password
         self.insecure = insecure
         self.docker_client = None
         
         if insecure:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _disable_insecure_warnings()
         
     def __enter__(self):
         try:
@@ -569,24 +891,32 @@ class HelmPackImporter:
         
         with tempfile.TemporaryDirectory(prefix="helmpack_import_") as temp_dir:
             # Extract bundle
-            with tarfile.open(bundle_path, 'r:gz') as tar:
-                tar.extractall(temp_dir)
+            _extract_tar_stream(bundle_path, temp_dir, fast=True)
             
             # Find bundle directory
-            bundle_dirs = [d for d in os.listdir(temp_dir) 
-                          if os.path.isdir(os.path.join(temp_dir, d))]
+            bundle_dirs = _list_subdirs(temp_dir)
             if not bundle_dirs:
                 raise ValueError("No bundle directory found in archive")
             
             bundle_dir = os.path.join(temp_dir, bundle_dirs[0])
             
-            # Load metadata
-            metadata_path = os.path.join(bundle_dir, "bundle.yaml")
-            with open(metadata_path, 'r') as f:
-                metadata = yaml.safe_load(f)
+            # Load metadata, preferring the JSON copy; older bundles only have YAML
+            try:
+                with open(os.path.join(bundle_dir, "bundle.json"), 'rb') as f:
+                    metadata = _json_loads(f.read())
+            except FileNotFoundError:
+                with open(os.path.join(bundle_dir, "bundle.yaml"), 'r') as f:
+                    metadata = yaml.load(f, Loader=_Loader)
             
             chart_info = metadata['chart']
-            images_info = metadata['images']
+            
+            # Entries without a reference can be neither pushed nor relocated
+            images_info = []
+            for image_info in metadata['images']:
+                if image_info.get('full_reference'):
+                    images_info.append(image_info)
+                else:
+                    logger.error(f"❌ Bundle image entry has no full_reference: {image_info}")
             
             # Import images
             self._import_images(bundle_dir, images_info, target_project)
@@ -614,42 +944,61 @@ class HelmPackImporter:
             self.docker_client.login(
                 username=self.harbor_username,
                 password=self.harbor_password,
-                registry=self.harbor_url.split('://')[-1]
+                registry=self.harbor_host
             )
         except Exception as e:
             logger.error(f"❌ Failed to login to Harbor: {e}")
             return
         
+        # Each Harbor tag is pushed by exactly one worker; the first reference wins
+        pushes: Dict[str, str] = {}
         for image_info in images_info:
-            try:
-                original_ref = image_info['full_reference']
-                
-                # Generate Harbor reference
-                harbor_ref = self._generate_harbor_reference(original_ref, target_project)
-                
-                # Load image from tar
-                image_filename = f"{original_ref.replace('/', '_').replace(':', '_')}.tar"
-                image_path = os.path.join(images_dir, image_filename)
-                
-                if os.path.exists(image_path):
-                    with open(image_path, 'rb') as f:
-                        images = self.docker_client.images.load(f.read())
-                    
-                    if images:
-                        loaded_image = images[0]
-                        
-                        # Tag for Harbor
-                        loaded_image.tag(harbor_ref)
-                        
-                        # Push to Harbor
-                        logger.info(f"  📤 Pushing {harbor_ref}")
-                        self.docker_client.images.push(harbor_ref)
-                        
-                        # Clean up local image
-                        self.docker_client.images.remove(loaded_image.id, force=True)
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to import image {original_ref}: {e}")
+            original_ref = image_info['full_reference']
+            harbor_ref = self._generate_harbor_reference(original_ref, target_project)
+            existing = pushes.setdefault(harbor_ref, original_ref)
+            if existing != original_ref:
+                logger.warning(f"⚠️  Skipping {original_ref}: {harbor_ref} is already pushed from {existing}")
+        
+        if not pushes:
+            return
+        
+        # Pushes are network-bound and independent; size the pool to the bundle
+        with ThreadPoolExecutor(max_workers=min(8, len(pushes))) as executor:
+            futures = {executor.submit(self._push_one, original_ref, harbor_ref, images_dir): original_ref
+                       for harbor_ref, original_ref in pushes.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"❌ Failed to import image {futures[future]}: {e}")
+    
+    def _push_one(self, original_ref: str, harbor_ref: str, images_dir: str):
+        """Load a single bundled image, retag it for Harbor and push it."""
+        # Load image from tar
+        image_path = os.path.join(images_dir, _image_archive_name(original_ref))
+        
+        try:
+            # Pass the file object so the archive is streamed, not read into memory
+            with open(image_path, 'rb') as f:
+                images = self.docker_client.images.load(f)
+        except FileNotFoundError:
+            return
+        
+        if not images:
+            return
+        
+        # Tag for Harbor
+        images[0].tag(harbor_ref)
+        
+        try:
+            # Push to Harbor; the low-level client returns the whole log at once
+            logger.info(f"  📤 Pushing {harbor_ref}")
+            output = self.docker_client.api.push(harbor_ref, stream=False)
+            if '"error"' in output:
+                raise RuntimeError(output.strip().splitlines()[-1])
+        finally:
+            # Drop only our tag; other workers may be pushing the same image ID
+            self.docker_client.images.remove(harbor_ref)
     
     def _import_chart(self, bundle_dir: str, chart_info: dict, target_project: str, images_info: List[dict]):
         """Import Helm chart with relocated image references."""
@@ -676,8 +1025,12 @@ class HelmPackImporter:
     
     def _generate_harbor_reference(self, original_ref: str, target_project: str) -> str:
         """Generate Harbor registry reference for an image."""
-        harbor_host = self.harbor_url.split('://')[-1]
-        
+        return self._harbor_reference(self.harbor_host, original_ref, target_project)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _harbor_reference(harbor_host: str, original_ref: str, target_project: str) -> str:
+        """Build a Harbor reference; cached since the same images recur across calls."""
         # Parse original reference
         parts = original_ref.split('/')
         if ':' in parts[-1]:
@@ -694,11 +1047,15 @@ class HelmPackImporter:
         """Relocate image references in chart files."""
         logger.info("🔄 Relocating image references...")
         
+        if not image_mapping:
+            return
+        pattern = self._compile_mapping_pattern(image_mapping)
+        
         # Update values.yaml files with structured approach
         for values_file in ['values.yaml', 'values.yml']:
             values_path = os.path.join(chart_dir, values_file)
             if os.path.exists(values_path):
-                self._relocate_images_in_values_file(values_path, image_mapping)
+                self._relocate_images_in_values_file(values_path, image_mapping, pattern)
         
         # Update template files with simple replacement
         templates_dir = os.path.join(chart_dir, 'templates')
@@ -707,9 +1064,15 @@ class HelmPackImporter:
                 for file in files:
                     if file.endswith(('.yaml', '.yml')):
                         file_path = os.path.join(root, file)
-                        self._relocate_images_in_file(file_path, image_mapping)
+                        self._relocate_images_in_file(file_path, image_mapping, pattern)
     
-    def _relocate_images_in_values_file(self, values_path: str, image_mapping: dict):
+    @staticmethod
+    def _compile_mapping_pattern(image_mapping: dict):
+        """Compile one alternation over all original references, longest first."""
+        refs = sorted(image_mapping, key=len, reverse=True)
+        return re.compile('|'.join(map(re.escape, refs)))
+    
+    def _relocate_images_in_values_file(self, values_path: str, image_mapping: dict, pattern=None):
         """Relocate image references in values.yaml with YAML structure awareness."""
         try:
             from ruamel.yaml import YAML
@@ -722,7 +1085,7 @@ class HelmPackImporter:
             
             if not values:
                 # Fallback to simple replacement
-                self._relocate_images_in_file(values_path, image_mapping)
+                self._relocate_images_in_file(values_path, image_mapping, pattern)
                 return
             
             modified = False
@@ -858,26 +1221,27 @@ class HelmPackImporter:
                 logger.info(f"  ✅ Updated {values_path}")
             else:
                 # If no structured updates, try simple replacement as fallback
-                self._relocate_images_in_file(values_path, image_mapping)
+                self._relocate_images_in_file(values_path, image_mapping, pattern)
             
         except Exception as e:
             logger.warning(f"Failed to relocate images in {values_path}: {e}")
             # Fallback to simple string replacement
-            self._relocate_images_in_file(values_path, image_mapping)
+            self._relocate_images_in_file(values_path, image_mapping, pattern)
     
-    def _relocate_images_in_file(self, file_path: str, image_mapping: dict):
+    def _relocate_images_in_file(self, file_path: str, image_mapping: dict, pattern=None):
         """Simple fallback method for image relocation."""
+        if not image_mapping:
+            return
+        if pattern is None:
+            pattern = self._compile_mapping_pattern(image_mapping)
+        
         try:
             with open(file_path, 'r') as f:
                 content = f.read()
             
-            modified = False
-            for original_ref, harbor_ref in image_mapping.items():
-                if original_ref in content:
-                    content = content.replace(original_ref, harbor_ref)
-                    modified = True
+            content, count = pattern.subn(lambda m: image_mapping[m.group(0)], content)
             
-            if modified:
+            if count:
                 with open(file_path, 'w') as f:
                     f.write(content)
                 logger.info(f"  ✅ Updated {file_path}")
@@ -888,8 +1252,6 @@ class HelmPackImporter:
     def _push_chart_to_harbor(self, chart_dir: str, target_project: str):
         """Package and push chart to Harbor registry."""
         try:
-            harbor_host = self.harbor_url.split('://')[-1]
-            
             # Package chart
             package_result = subprocess.run(
                 ['helm', 'package', chart_dir],
@@ -904,7 +1266,7 @@ class HelmPackImporter:
             chart_package = chart_files[-1]  # Get the latest
             
             # Push to Harbor using helm
-            harbor_chart_url = f"oci://{harbor_host}/{target_project}"
+            harbor_chart_url = f"oci://{self.harbor_host}/{target_project}"
             push_result = subprocess.run(
                 ['helm', 'push', chart_package, harbor_chart_url],
                 capture_output=True, text=True, check=True
@@ -920,6 +1282,119 @@ class HelmPackImporter:
         except Exception as e:
             logger.error(f"❌ Unexpected error pushing chart: {e}")
 
+def _probe_registry(harbor_url: str, username: str, password: str, verify_ssl: bool) -> Tuple[bool, str]:
+    """Check registry credentials over the Docker Registry v2 HTTP API.
+    
+    Follows the /v2/ auth challenge (basic or bearer token) without involving a Docker daemon.
+    """
+    v2_url = f"{harbor_url.rstrip('/')}/v2/"
+    response = _http_session().get(v2_url, timeout=10, verify=verify_ssl)
+    if response.status_code == 200:
+        return True, "registry allows anonymous access"
+    if response.status_code != 401:
+        return False, f"unexpected status {response.status_code} from {v2_url}"
+    
+    challenge = response.headers.get('Www-Authenticate', '')
+    scheme = challenge.split(' ', 1)[0].lower()
+    if scheme == 'bearer':
+        params = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+        if 'realm' not in params:
+            return False, f"malformed auth challenge: {challenge}"
+        response = _http_session().get(
+            params['realm'],
+            params={'service': params['service']} if 'service' in params else None,
+            auth=(username, password),
+            timeout=10,
+            verify=verify_ssl
+        )
+    else:
+        response = _http_session().get(v2_url, auth=(username, password), timeout=10, verify=verify_ssl)
+    
+    if response.status_code == 200:
+        return True, "credentials accepted"
+    return False, f"credentials rejected ({response.status_code})"
+
+def _scan_bundle(bundle_path: str) -> dict:
+    """Read bundle metadata and image archive totals from the tarball."""
+    # Scan the archive members; only the metadata file is actually read
+    metadata = None
+    has_images_dir = False
+    image_count = 0
+    total_size = 0
+    with _open_bundle_tar(bundle_path) as tar:
+        for member in tar:
+            parts = member.name.split('/')
+            if len(parts) == 2 and parts[1] == 'bundle.json' and member.isfile():
+                metadata = _json_loads(tar.extractfile(member).read())
+            elif len(parts) == 2 and parts[1] == 'bundle.yaml' and member.isfile():
+                # Older bundles only carry YAML metadata
+                if metadata is None:
+                    metadata = yaml.load(tar.extractfile(member), Loader=_Loader)
+            elif len(parts) >= 2 and parts[1] == 'images':
+                has_images_dir = True
+                if len(parts) == 3 and parts[2].endswith('.tar') and member.isfile():
+                    image_count += 1
+                    total_size += member.size
+    
+    if metadata is None:
+        raise ValueError("Invalid bundle: no bundle metadata found")
+    
+    return {
+        'metadata': metadata,
+        'has_images_dir': has_images_dir,
+        'image_count': image_count,
+        'total_size': total_size,
+    }
+
+def _cached_bundle_summary(bundle_path: str) -> dict:
+    """Return _scan_bundle() results, cached on disk per bundle path, mtime and size."""
+    cache_path = os.path.join(_cache_dir(), f"{_bundle_cache_key(bundle_path)}.json")
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            summary = _json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+    else:
+        # Mark as recently used so pruning keeps it; a read-only cache still serves hits
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return summary
+    
+    summary = _scan_bundle(bundle_path)
+    try:
+        payload = json.dumps(summary)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write then rename so concurrent runs never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+        _prune_cache()
+    except (OSError, TypeError) as e:
+        logger.debug(f"Could not cache bundle info {cache_path}: {e}")
+    return summary
+
+def _prune_cache(max_entries: int = _CACHE_MAX_ENTRIES, max_age: float = _CACHE_MAX_AGE):
+    """Drop cache files unused for max_age seconds, then the oldest beyond max_entries."""
+    now = time.time()
+    entries = []
+    with os.scandir(_cache_dir()) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if now - mtime > max_age:
+                with contextlib.suppress(OSError):
+                    os.remove(entry.path)
+            elif not entry.name.endswith('.tmp'):
+                entries.append((mtime, entry.path))
+    
+    entries.sort(reverse=True)
+    for _, path in entries[max_entries:]:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
 # CLI Interface
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
@@ -943,10 +1418,13 @@ def bundle(chart, output, no_images, include_signatures):
     - Path to a .tgz chart archive
     """
     try:
-        with HelmChartAnalyzer() as analyzer:
-            chart_info = analyzer.analyze_chart(chart)
+        with HelmPackBundler() as bundler:
+            # Start pulling images while the rest of the chart tree is still being analyzed
+            on_image = None if no_images else bundler.prefetch_image
             
-            with HelmPackBundler() as bundler:
+            with HelmChartAnalyzer(on_image=on_image) as analyzer:
+                chart_info = analyzer.analyze_chart(chart)
+                
                 bundle_path = bundler.create_bundle(
                     chart_info=chart_info,
                     output_path=output,
@@ -955,22 +1433,28 @@ def bundle(chart, output, no_images, include_signatures):
                 )
                 
                 # Display summary
-                click.echo("\n" + "="*60)
-                click.echo(f"📦 Bundle Summary")
-                click.echo("="*60)
-                click.echo(f"Chart: {chart_info.name} v{chart_info.version}")
-                click.echo(f"Dependencies: {len(chart_info.dependencies)}")
-                click.echo(f"Total Images: {len(chart_info.images)}")
-                click.echo(f"Bundle: {bundle_path}")
+                n_images = len(chart_info.images)
+                n_deps = len(chart_info.dependencies)
+                out = [
+                    "\n" + "="*60,
+                    f"📦 Bundle Summary",
+                    "="*60,
+                    f"Chart: {chart_info.name} v{chart_info.version}",
+                    f"Dependencies: {n_deps}",
+                    f"Total Images: {n_images}",
+                    f"Bundle: {bundle_path}",
+                ]
                 
-                if chart_info.images:
-                    click.echo(f"\n🐳 Images included:")
-                    for img in chart_info.images[:10]:  # Show first 10
-                        click.echo(f"  • {img.full_reference} (from {img.chart_source})")
-                    if len(chart_info.images) > 10:
-                        click.echo(f"  ... and {len(chart_info.images) - 10} more")
+                if n_images:
+                    out.append(f"\n🐳 Images included:")
+                    out.extend(f"  • {img.full_reference} (from {img.chart_source})"
+                               for img in islice(chart_info.images, 10))  # Show first 10
+                    if n_images > 10:
+                        out.append(f"  ... and {n_images - 10} more")
                 
-                click.echo("\n✅ Bundle created successfully!")
+                out.append("\n✅ Bundle created successfully!")
+                
+                click.echo('\n'.join(out))
                 
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
@@ -1008,35 +1492,37 @@ def analyze(chart):
     try:
         with HelmChartAnalyzer() as analyzer:
             chart_info = analyzer.analyze_chart(chart)
+            n_images = len(chart_info.images)
+            n_deps = len(chart_info.dependencies)
             
-            click.echo("\n" + "="*60)
-            click.echo(f"📊 Chart Analysis: {chart_info.name} v{chart_info.version}")
-            click.echo("="*60)
+            out = [
+                "\n" + "="*60,
+                f"📊 Chart Analysis: {chart_info.name} v{chart_info.version}",
+                "="*60,
+            ]
             
-            click.echo(f"\n📦 Dependencies ({len(chart_info.dependencies)}):")
-            if chart_info.dependencies:
-                for dep in chart_info.dependencies:
-                    click.echo(f"  • {dep.name} v{dep.version}")
+            out.append(f"\n📦 Dependencies ({n_deps}):")
+            if n_deps:
+                out.extend(f"  • {dep.name} v{dep.version}" for dep in chart_info.dependencies)
             else:
-                click.echo("  None")
+                out.append("  None")
             
-            click.echo(f"\n🐳 Container Images ({len(chart_info.images)}):")
-            if chart_info.images:
+            out.append(f"\n🐳 Container Images ({n_images}):")
+            if n_images:
                 # Group by chart source
-                by_chart = {}
+                by_chart = defaultdict(list)
                 for img in chart_info.images:
-                    if img.chart_source not in by_chart:
-                        by_chart[img.chart_source] = []
                     by_chart[img.chart_source].append(img)
                 
                 for chart_name, images in by_chart.items():
-                    click.echo(f"\n  From {chart_name}:")
-                    for img in images:
-                        click.echo(f"    • {img.full_reference}")
+                    out.append(f"\n  From {chart_name}:")
+                    out.extend(f"    • {img.full_reference}" for img in images)
             else:
-                click.echo("  None found")
+                out.append("  None found")
             
-            click.echo(f"\n📍 Chart Location: {chart_info.path}")
+            out.append(f"\n📍 Chart Location: {chart_info.path}")
+            
+            click.echo('\n'.join(out))
             
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
@@ -1047,64 +1533,49 @@ def analyze(chart):
 def info(bundle_path):
     """Show information about a bundle without importing it."""
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract bundle
-            with tarfile.open(bundle_path, 'r:gz') as tar:
-                tar.extractall(temp_dir)
-            
-            # Find bundle directory
-            bundle_dirs = [d for d in os.listdir(temp_dir) 
-                          if os.path.isdir(os.path.join(temp_dir, d))]
-            if not bundle_dirs:
-                raise ValueError("Invalid bundle: no bundle directory found")
-            
-            bundle_dir = os.path.join(temp_dir, bundle_dirs[0])
-            
-            # Load metadata
-            metadata_path = os.path.join(bundle_dir, "bundle.yaml")
-            with open(metadata_path, 'r') as f:
-                metadata = yaml.safe_load(f)
-            
-            chart_info = metadata['chart']
-            images_info = metadata['images']
-            bundle_metadata = metadata['metadata']
-            
-            click.echo("\n" + "="*60)
-            click.echo(f"📦 Bundle Information")
-            click.echo("="*60)
-            click.echo(f"Chart: {chart_info['name']} v{chart_info['version']}")
-            click.echo(f"Generated: {bundle_metadata.get('generatedAt', 'Unknown')}")
-            click.echo(f"Generated By: {bundle_metadata.get('generatedBy', 'Unknown')}")
-            click.echo(f"Dependencies: {len(chart_info.get('dependencies', []))}")
-            click.echo(f"Images: {len(images_info)}")
+        summary = _cached_bundle_summary(bundle_path)
+        metadata = summary['metadata']
+        has_images_dir = summary['has_images_dir']
+        image_count = summary['image_count']
+        total_size = summary['total_size']
+        
+        chart_info = metadata['chart']
+        images_info = metadata['images']
+        bundle_metadata = metadata['metadata']
+        n_images = len(images_info)
+        n_deps = len(chart_info.get('dependencies', []))
+        
+        out = [
+            "\n" + "="*60,
+            f"📦 Bundle Information",
+            "="*60,
+            f"Chart: {chart_info['name']} v{chart_info['version']}",
+            f"Generated: {bundle_metadata.get('generatedAt', 'Unknown')}",
+            f"Generated By: {bundle_metadata.get('generatedBy', 'Unknown')}",
+            f"Dependencies: {n_deps}",
+            f"Images: {n_images}",
+        ]
+        
+        # Check if images are included
+        if has_images_dir:
+            out.append(f"Image Archives: {image_count} files")
             
-            # Check if images are included
-            images_dir = os.path.join(bundle_dir, "images")
-            if os.path.exists(images_dir):
-                image_files = [f for f in os.listdir(images_dir) if f.endswith('.tar')]
-                click.echo(f"Image Archives: {len(image_files)} files")
-                
-                # Calculate total size
-                total_size = 0
-                for img_file in image_files:
-                    img_path = os.path.join(images_dir, img_file)
-                    total_size += os.path.getsize(img_path)
-                
-                size_mb = total_size / (1024 * 1024)
-                if size_mb > 1024:
-                    click.echo(f"Images Size: {size_mb/1024:.1f} GB")
-                else:
-                    click.echo(f"Images Size: {size_mb:.1f} MB")
+            size_mb = total_size / (1024 * 1024)
+            if size_mb > 1024:
+                out.append(f"Images Size: {size_mb/1024:.1f} GB")
             else:
-                click.echo("Image Archives: Not included")
-            
-            if images_info:
-                click.echo(f"\n🐳 Container Images:")
-                for img in images_info[:15]:  # Show first 15
-                    click.echo(f"  • {img['full_reference']}")
-                if len(images_info) > 15:
-                    click.echo(f"  ... and {len(images_info) - 15} more")
-            
+                out.append(f"Images Size: {size_mb:.1f} MB")
+        else:
+            out.append("Image Archives: Not included")
+        
+        if n_images:
+            out.append(f"\n🐳 Container Images:")
+            out.extend(f"  • {img['full_reference']}" for img in islice(images_info, 15))  # Show first 15
+            if n_images > 15:
+                out.append(f"  ... and {n_images - 15} more")
+        
+        click.echo('\n'.join(out))
+        
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
         sys.exit(1)
@@ -1114,7 +1585,8 @@ def info(bundle_path):
 @click.option('--harbor-user', required=True, help='Harbor username')
 @click.option('--harbor-password', required=True, help='Harbor password')
 @click.option('--insecure', is_flag=True, help='Skip SSL certificate verification')
-def test_harbor(harbor_url, harbor_user, harbor_password, insecure):
+@click.option('--via-docker', is_flag=True, help='Validate the registry login through the Docker daemon')
+def test_harbor(harbor_url, harbor_user, harbor_password, insecure, via_docker):
     """Test connectivity to Harbor registry."""
     try:
         # Test Harbor API
@@ -1124,11 +1596,10 @@ def test_harbor(harbor_url, harbor_user, harbor_password, insecure):
         # Configure SSL verification
         verify_ssl = not insecure
         if insecure:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _disable_insecure_warnings()
             click.echo("⚠️  SSL certificate verification disabled")
         
-        response = requests.get(
+        response = _http_session().get(
             api_url,
             auth=(harbor_user, harbor_password),
             timeout=10,
@@ -1137,7 +1608,7 @@ def test_harbor(harbor_url, harbor_user, harbor_password, insecure):
         
         if response.status_code == 200:
             click.echo(f"✅ Harbor API connection successful")
-            system_info = response.json()
+            system_info = _json_loads(response.content)
             click.echo(f"Harbor Version: {system_info.get('harbor_version', 'Unknown')}")
             click.echo(f"Registry URL: {system_info.get('registry_url', 'Unknown')}")
         else:
@@ -1146,6 +1617,16 @@ def test_harbor(harbor_url, harbor_user, harbor_password, insecure):
                 click.echo(f"Response: {response.text}")
             return
         
+        # Test registry login directly over HTTP unless Docker-level validation is requested
+        if not via_docker:
+            ok, detail = _probe_registry(harbor_host, harbor_user, harbor_password, verify_ssl)
+            if ok:
+                click.echo(f"✅ Registry login successful ({detail})")
+            else:
+                click.echo(f"❌ Registry login failed: {detail}")
+            click.echo(f"\n🎉 Harbor connectivity test completed!")
+            return
+        
         # Test Docker registry login
         try:
             if not DOCKER_AVAILABLE: